@@ -10,6 +10,7 @@ Authors:
 Copyright ©2017, Apache v2.0 License
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
 
@@ -22,7 +23,16 @@ from utilities import fetch_data
 
 data = dict()
 urls = config.raw_urls()
-for sensor, device in urls.items():
-    for device, url in device.items():
-        data[sensor] = {device:None}
-        data[sensor][device] = fetch_data.fetch_data(url)
\ No newline at end of file
+# downloads are independent and I/O-bound, so fetch a few at a time
+with ThreadPoolExecutor(max_workers=4) as executor:
+    downloads = {(sensor, device): executor.submit(fetch_data.fetch_data, url)
+                 for sensor, devices in urls.items()
+                 for device, url in devices.items()}
+    try:
+        for (sensor, device), download in downloads.items():
+            data.setdefault(sensor, dict())[device] = download.result()
+    except:
+        # don't wait on queued downloads once one has failed
+        for download in downloads.values():
+            download.cancel()
+        raise
@@ -14,7 +14,8 @@ Created on Mon Apr 10 17:25:39 2017
 from astropy.stats import median_absolute_deviation as mad
 from config import config
 from datetime import datetime, timedelta
-from utilities.fetch_data import fetch_check_data, fetch_data, fetch_hash
+from utilities.fetch_data import fetch_check_data, fetch_data, fetch_hash, \
+                                 read_device_csv
 from utilities.normalize_acc_data import normalize as norm
 import json, numpy as np, os, pandas as pd
 from matplotlib.dates import DateFormatter
@@ -82,15 +83,13 @@ def df_devices_qt(devices, sensor, start, stop, acc_hashes={}):
     suffix = '.csv'
     s = []
     for i, device in enumerate(devices):
-        s.append(pd.read_csv(fetch_data(config.rawurls[
-                 sensor][device[1]]),
-                 parse_dates=['Timestamp'], infer_datetime_format=True))
+        s.append(read_device_csv(config.rawurls[sensor][device[1]]))
         s[i] = s[i].loc[(s[i]['Timestamp'] >= start) & (s[i]['Timestamp'] <=
                stop)].copy()
         s[i] = norm(s[i])
         if device[1] == 'ActiGraph wGT3X-BT':
-            s[i][['Timestamp']] = s[i].Timestamp.apply(lambda x: x - 
-                                  timedelta(microseconds=1000))
+            s[i]['Timestamp'] = s[i]['Timestamp'] - timedelta(
+                                microseconds=1000)
         s[i].set_index('Timestamp', inplace=True)
     df = s[0].merge(s[1], left_index=True, right_index=True, suffixes=(''.join(
          ['_', devices[0][1]]), ''.join(['_', devices[1][1]])))
@@ -149,12 +148,9 @@ def linechart(df, plot_label, line=True, full=False):
     -------
     inline plot
     """
-    try:
-        start = min(df.index.values)
-    except:
+    if df.index.empty:
         print("End of data.")
         return False
-    stop = max(df.index.values)
     print("Plotting...")
     print(plot_label)
     fig = plt.figure(figsize=(10, 8), dpi=75)
@@ -180,8 +176,9 @@ def linechart(df, plot_label, line=True, full=False):
                 print(mp)
                 mad_values.append(mp)
             else:
-                print(max(plot_line[[device]]))
-                mad_values.append(max(plot_line[[device]]))
+                mp = plot_line[device].max()
+                print(mp)
+                mad_values.append(mp)
         label = d2
         for c in color_key:
             if c in d2 or d2 in c:
@@ -201,7 +198,7 @@ def linechart(df, plot_label, line=True, full=False):
             ax.plot_date(x=plot_line.index, y=plot_line, alpha=0.4,
                          label=label, marker="o", linestyle="None",
                          color=cmap)
-        ax.legend(loc='best', fancybox=True, framealpha=0.5)
+    ax.legend(loc='best', fancybox=True, framealpha=0.5)
     try:
         ylim = max(mad_values)
     except:
@@ -269,8 +266,11 @@ def xcorr(x,y):
     meany = np.nanmean(y)
     stdy = np.nanstd(np.asarray(y))
     tmp = rolling_window(x,M)
-    c = np.nansum((y-meany)*(tmp-np.reshape(np.nanmean(tmp,-1),(N-M+1,1))),-1
-        )/(M*np.nanstd(tmp,-1)*stdy)
+    # center each window once and reuse it for both the covariance and the
+    # standard deviation rather than letting np.nanstd recompute the means
+    tmp = tmp-np.reshape(np.nanmean(tmp,-1),(N-M+1,1))
+    stdtmp = np.sqrt(np.nanmean(tmp**2,-1))
+    c = np.nansum((y-meany)*tmp,-1)/(M*stdtmp*stdy)
     return(c)
 
 # ============================================================================
@@ -12,8 +12,12 @@ Copyright 2016,  Mindboggle team (http://mindboggle.info), Apache v2.0 License
 """
 from config import config
 from datetime import timedelta
+from functools import lru_cache
 import pandas as pd
 
+# temporary files already downloaded this session, by (url, append)
+fetched_files = {}
+
 def cache_hashes():
     """
     Hashes to verify retrieved data cached by the Mindboggle software.
@@ -82,19 +86,16 @@ def df_devices(devices, sensor, start=None, stop=None):
     s = []
     for i, device in enumerate(devices):
         device_suffix = device.replace(" ", "_")
-        d = pd.read_csv(fetch_data(config.rawurls[
-            sensor][device]), parse_dates=['Timestamp'],
-            infer_datetime_format=True)
+        d = read_device_csv(config.rawurls[sensor][device])
         start = min(d['Timestamp']) if not start else start
         stop = max(d['Timestamp']) if not stop else stop
         d = d.loc[(d['Timestamp'] >= start) & (d['Timestamp'] <=
                stop)].copy()
         if device == 'ActiGraph wGT3X-BT':
-            d[['Timestamp']] = d.Timestamp.apply(lambda x: x - 
-                                  timedelta(microseconds=1000))
+            d['Timestamp'] = d['Timestamp'] - timedelta(microseconds=1000)
         d.set_index('Timestamp', inplace=True)
-        for c in d.columns:
-            d.rename(columns={c: "_".join([c, device_suffix])}, inplace=True)
+        d.rename(columns={c: "_".join([c, device_suffix]) for c in
+                 d.columns}, inplace=True)
         s.append(d)
         
     df = s[0].merge(s[1], left_index=True, right_index=True, suffixes=(''.join(
@@ -105,6 +106,34 @@ def df_devices(devices, sensor, start=None, stop=None):
     return(df)
 
 
+@lru_cache(maxsize=3)
+def _read_device_csv(url):
+    # parsed frames for the devices in the current comparison; only ever
+    # handed out as copies by read_device_csv()
+    return(pd.read_csv(fetch_data(url), parse_dates=['Timestamp'],
+           infer_datetime_format=True))
+
+
+def read_device_csv(url):
+    """
+    Function to fetch and parse an organized device csv file. The parsed
+    dataframes for the last few files are cached, so repeated comparisons
+    over different time windows only parse each file once.
+
+    Parameters
+    ----------
+    url : string
+        versioned OSF URL for an organized csv file (from config/config.py)
+
+    Returns
+    -------
+    df : pandas dataframe
+        a copy of the parsed dataframe, with a parsed 'Timestamp' column,
+        that is safe to modify in place
+    """
+    return(_read_device_csv(url).copy())
+
+
 def test_urls():
     """
     URLs corresponding to Mindboggle test (example output) data.
@@ -423,7 +452,8 @@ def fetch_data(url, output_file='', append=''):
     """
     Download file from a URL to a specified or a temporary file.
 
-    Optionally append to file name.
+    Optionally append to file name. Temporary files are reused for repeated
+    requests for the same URL as long as they still exist.
 
     Parameters
     ----------
@@ -454,6 +484,13 @@ def fetch_data(url, output_file='', append=''):
     import os
     import urllib.request
 
+    # Reuse a temporary file from an earlier call if it is still there:
+    if not output_file:
+        cached_file = fetched_files.get((url, append))
+        if cached_file and os.path.exists(cached_file):
+            return cached_file
+
+    temporary = not output_file
     output_file, foo = urllib.request.urlretrieve(url, output_file)
 
     # Add append if assigned:
@@ -461,6 +498,9 @@ def fetch_data(url, output_file='', append=''):
         os.rename(output_file, output_file + append)
         output_file += append
 
+    if temporary:
+        fetched_files[(url, append)] = output_file
+
     return output_file
 
 
@@ -45,14 +45,15 @@ def normalize(df, scale=None):
     """
     cols = ['x', 'y', 'z']
     if not scale:
-        scale = max([max(df[ax].max(), abs(df[ax].min())) for ax in cols])        
+        scale = df[cols].abs().max().max()
     unit = np.float64(sqrt(3*(scale**2)))
     try:
         df['Timestamp'] = df['Timestamp'].map(parser.parse, 'ignore')
     except:
         pass
-    df['normalized_vector_length'] = np.sqrt((df['x'] / unit) ** 2 + (df['y'] /
-                                     unit) ** 2 + (df['z'] / unit) ** 2)
+    # scale once after taking the vector length rather than once per axis
+    df['normalized_vector_length'] = np.sqrt(df['x'] ** 2 + df['y'] ** 2 +
+                                     df['z'] ** 2) / unit
     return(df)
 
 # ============================================================================
@@ -42,18 +42,14 @@ def actigraph_acc(dirpath):
         comma-separated-values file with Linux time-series index column and x,
         y, z accelerometer value columns
     """
-    acc_data = pd.DataFrame
+    acc_dfs = []
     for acc in os.listdir(dirpath):
         if acc.endswith("1sec.csv"):
-            if acc_data.empty:
-                with open(os.path.join(dirpath, acc), 'r') as acc_f:
-                    acc_data = actigraph_acc_data(acc_f)
-            else:
-                with open(os.path.join(dirpath, acc), 'r') as acc_f:
-                    acc_data = pd.concat([acc_data, actigraph_acc_data(acc_f)])
+            with open(os.path.join(dirpath, acc), 'r') as acc_f:
+                acc_dfs.append(actigraph_acc_data(acc_f))
             print(' : '.join(['Actigraph accelorometer data, adding', acc, str(
-                  acc_data.shape)]))
-    save_df(acc_data, 'accelerometer', 'Actigraph')
+                  acc_dfs[-1].shape)]))
+    save_df(concat_dfs(acc_dfs), 'accelerometer', 'Actigraph')
 
 def actigraph_acc_data(open_csv):
     """
@@ -79,8 +75,7 @@ def actigraph_acc_data(open_csv):
                                            'axis3']]
     new_df.set_index('Timestamp', inplace=True)
     # convert from 1/512g to g
-    for axis in axes:
-        new_df[axis] = new_df[axis].map(lambda x: float(x)/512)
+    new_df[axes] = new_df[axes].astype(float) / 512
     return(new_df)
 
 def actigraph_datetimeint(x):
@@ -124,25 +119,17 @@ def actigraph_1c(dirpath, feature):
         y, z accelerometer value columns
     """
     sensors = {'lux':'light', 'hr':'heartrate'}
-    acc_data = pd.DataFrame
+    acc_dfs = []
     for acc in os.listdir(dirpath):
         if acc.endswith("1sec.csv"):
-            if acc_data.empty:
-                with open(os.path.join(dirpath, acc), 'r') as acc_f:
-                    try:
-                        acc_data = actigraph_1c_data(acc_f, feature)
-                    except:
-                        pass
-            else:
-                with open(os.path.join(dirpath, acc), 'r') as acc_f:
-                    try:
-                        acc_data = pd.concat([acc_data, actigraph_1c_data(
-                                   acc_f, feature)])
-                    except:
-                        pass
+            with open(os.path.join(dirpath, acc), 'r') as acc_f:
+                try:
+                    acc_dfs.append(actigraph_1c_data(acc_f, feature))
+                except:
+                    continue
             print(' : '.join([' '.join(['Actigraph', sensors[feature] ,
-                  'data, adding']), acc, str(acc_data.shape)]))
-    save_df(acc_data, sensors[feature], 'Actigraph')
+                  'data, adding']), acc, str(acc_dfs[-1].shape)]))
+    save_df(concat_dfs(acc_dfs), sensors[feature], 'Actigraph')
 
 def actigraph_1c_data(open_csv, feature):
     """
@@ -197,26 +184,20 @@ def e4_acc(dirpath):
         comma-separated-values file with Linux time-series index column and x,
         y, z accelerometer value columns
     """
-    acc_data = pd.DataFrame()
+    acc_dfs = []
     for d in os.listdir(dirpath):
         d = os.path.join(dirpath, d)
         if os.path.isdir(d):
             for acc in os.listdir(d):
                 if "ACC" in acc and acc.endswith("csv"):
-                    if acc_data.empty:
-                        acc_data = e4_timestamp(pd.read_csv(os.path.join(
-                                   dirpath, d, acc),
-                                   names=axes, index_col=False))
-                        print(' : '.join([acc, str(acc_data.shape)]))
-                    else:
-                        acc_data = pd.concat([acc_data, e4_timestamp(
-                                   pd.read_csv(os.path.join(dirpath, d, acc),
-                                   names=axes, index_col=False))])
+                    acc_dfs.append(e4_timestamp(pd.read_csv(os.path.join(
+                                   dirpath, d, acc), names=axes,
+                                   index_col=False)))
                     print(' : '.join(['E4 accelorometer data, adding',  acc, str(
-                          acc_data.shape)]))
+                          acc_dfs[-1].shape)]))
+    acc_data = concat_dfs(acc_dfs)
     # convert from 1/64g to g
-    for axis in axes:
-        acc_data[axis] = acc_data[axis].map(lambda x: float(x)/64)
+    acc_data[axes] = acc_data[axes].astype(float) / 64
     save_df(acc_data, 'accelerometer', 'E4')
 
 def e4_ppg(dirpath):
@@ -240,25 +221,18 @@ def e4_ppg(dirpath):
         comma-separated-values file with Linux time-series index column and
         nanowatt value column
     """
-    ppg_data = pd.DataFrame()
+    ppg_dfs = []
     for d in os.listdir(dirpath):
         d = os.path.join(dirpath, d)
         if os.path.isdir(d):
             for ppg in os.listdir(d):
                 if "BVP" in ppg and ppg.endswith("csv"):
-                    if ppg_data.empty:
-                        ppg_data = e4_timestamp(pd.read_csv(os.path.join(
+                    ppg_dfs.append(e4_timestamp(pd.read_csv(os.path.join(
                                    dirpath, d, ppg), names=['nW'], index_col=
-                                   False))
-                        print(' : '.join([ppg, str(ppg_data.shape)]))
-                    else:
-                        ppg_data = pd.concat([ppg_data, e4_timestamp(
-                                   pd.read_csv(
-                                   os.path.join(dirpath, d, ppg), names=['nW'],
-                                   index_col=False))])
+                                   False)))
                     print(' : '.join(['E4 photoplethysmograph data, adding',
-                          ppg, str(ppg_data.shape)]))
-    save_df(ppg_data, 'photoplethysmograph', 'E4')
+                          ppg, str(ppg_dfs[-1].shape)]))
+    save_df(concat_dfs(ppg_dfs), 'photoplethysmograph', 'E4')
 
 
 def e4_timestamp(df):
@@ -313,25 +287,19 @@ def e4_1c(dirpath, feature):
         feature value columns
     """
     sensors = {'HR':'heartrate', 'TEMP':'temperature', 'EDA':'EDA'}
-    feat_data = pd.DataFrame()
+    feat_dfs = []
     for d in os.listdir(dirpath):
         d = os.path.join(dirpath, d)
         if os.path.isdir(d):
             for feat_file in os.listdir(d):
                 if feature in feat_file and feat_file.endswith("csv"):
-                    if feat_data.empty:
-                        feat_data = e4_timestamp(pd.read_csv(os.path.join(
+                    feat_dfs.append(e4_timestamp(pd.read_csv(os.path.join(
                                     dirpath, d, feat_file), names=[sensors[
-                                    feature]], index_col=False))
-                        print(' : '.join([feat_file, str(feat_data.shape)]))
-                    else:
-                        feat_data = pd.concat([feat_data, e4_timestamp(
-                                    pd.read_csv(os.path.join(dirpath, d,
-                                    feat_file), names=[sensors[feature]],
-                                    index_col=False))])
+                                    feature]], index_col=False)))
                     print(' : '.join(['E4 ', ' '.join([sensors[feature],
-                          'data, adding']),  feat_file, str(feat_data.shape)]))
-    save_df(feat_data, sensors[feature], 'E4')
+                          'data, adding']),  feat_file, str(feat_dfs[-1].shape
+                          )]))
+    save_df(concat_dfs(feat_dfs), sensors[feature], 'E4')
 
 """
 ----------------
@@ -372,31 +340,21 @@ def geneactiv_acc(dirpath):
         comma-separated-values file with Linux time-series index column and x,
         y, z accelerometer value columns
     """
-    acc_data_black = pd.DataFrame()
-    acc_data_pink = pd.DataFrame()
+    acc_dfs_black = []
+    acc_dfs_pink = []
     for acc in os.listdir(dirpath):
         if ("Jon" in acc or "black" in acc) and acc.endswith("csv"):
-            if acc_data_black.empty:
-                with open(os.path.join(dirpath, acc), 'r') as acc_f:
-                    acc_data_black = geneactiv_acc_data(acc_f)
-            else:
-                with open(os.path.join(dirpath, acc), 'r') as acc_f:
-                    acc_data_black = pd.concat([acc_data_black,
-                                     geneactiv_acc_data(acc_f)])
+            with open(os.path.join(dirpath, acc), 'r') as acc_f:
+                acc_dfs_black.append(geneactiv_acc_data(acc_f))
             print(' : '.join(['Black GENEActiv accelorometer data, adding',
-                  acc, str(acc_data_black.shape)]))
+                  acc, str(acc_dfs_black[-1].shape)]))
         elif (("Curt" in acc or "Arno" in acc or "pink" in acc) and acc.endswith("csv")):
-            if acc_data_pink.empty:
-                with open(os.path.join(dirpath, acc), 'r') as acc_f:
-                    acc_data_pink = geneactiv_acc_data(acc_f)
-            else:
-                with open(os.path.join(dirpath, acc), 'r') as acc_f:
-                    acc_data_pink = pd.concat([acc_data_pink,
-                                     geneactiv_acc_data(acc_f)])
+            with open(os.path.join(dirpath, acc), 'r') as acc_f:
+                acc_dfs_pink.append(geneactiv_acc_data(acc_f))
             print(' : '.join(['Pink GENEActiv accelorometer data, adding',
-                  acc, str(acc_data_pink.shape)]))
-    save_df(acc_data_black, 'accelerometer', 'GENEActiv_black')
-    save_df(acc_data_pink, 'accelerometer', 'GENEActiv_pink')
+                  acc, str(acc_dfs_pink[-1].shape)]))
+    save_df(concat_dfs(acc_dfs_black), 'accelerometer', 'GENEActiv_black')
+    save_df(concat_dfs(acc_dfs_pink), 'accelerometer', 'GENEActiv_pink')
 
 def geneactiv_acc_data(open_csv):
     """
@@ -420,8 +378,7 @@ def geneactiv_acc_data(open_csv):
     new_df[['Timestamp', 'x', 'y', 'z']] = df[[0,1,2,3]]
     new_df.set_index('Timestamp', inplace=True)
     # convert from 1/8g to g
-    for axis in axes:
-        new_df[axis] = new_df[axis].map(lambda x: float(x)/4)
+    new_df[axes] = new_df[axes].astype(float) / 4
     return(new_df)
 
 def geneactiv_1c(dirpath, feature):
@@ -450,36 +407,24 @@ def geneactiv_1c(dirpath, feature):
         feature value columns
     """
     sensor = {4:'light', 6:'temperature'}
-    feat_data_black = pd.DataFrame()
-    feat_data_pink = pd.DataFrame()
+    feat_dfs_black = []
+    feat_dfs_pink = []
     for feat_file in os.listdir(dirpath):
         if ("Jon" in feat_file or "black" in feat_file) and feat_file.endswith("csv"):
-            if feat_data_black.empty:
-                with open(os.path.join(dirpath, feat_file), 'r') as fd_f:
-                    feat_data_black = geneactiv_1c_data(fd_f, feature, sensor[
-                                      feature])
-            else:
-                with open(os.path.join(dirpath, feat_file), 'r') as fd_f:
-                    feat_data_black = pd.concat([feat_data_black,
-                                     geneactiv_1c_data(fd_f, feature, sensor[
-                                                       feature])])
+            with open(os.path.join(dirpath, feat_file), 'r') as fd_f:
+                feat_dfs_black.append(geneactiv_1c_data(fd_f, feature, sensor[
+                                      feature]))
             print(' : '.join(['Black GENEActiv ', ' '.join([sensor[feature],
-                  'data, adding']), feat_file, str(feat_data_black.shape)]))
+                  'data, adding']), feat_file, str(feat_dfs_black[-1].shape)]))
         elif (("Curt" in feat_file or "Arno" in feat_file or "pink" in feat_file) and
               feat_file.endswith("csv")):
-            if feat_data_pink.empty:
-                with open(os.path.join(dirpath, feat_file), 'r') as fd_f:
-                    feat_data_pink = geneactiv_1c_data(fd_f, feature, sensor[
-                                     feature])
-            else:
-                with open(os.path.join(dirpath, feat_file), 'r') as fd_f:
-                    feat_data_pink = pd.concat([feat_data_pink,
-                                     geneactiv_1c_data(fd_f, feature, sensor[
-                                                       feature])])
+            with open(os.path.join(dirpath, feat_file), 'r') as fd_f:
+                feat_dfs_pink.append(geneactiv_1c_data(fd_f, feature, sensor[
+                                     feature]))
             print(' : '.join(['Pink GENEActiv,', ' '.join([sensor[feature],
-                  'data, adding']), feat_file, str(feat_data_pink.shape)]))
-    save_df(feat_data_black, sensor[feature], 'GENEActiv_black')
-    save_df(feat_data_pink, sensor[feature], 'GENEActiv_pink')
+                  'data, adding']), feat_file, str(feat_dfs_pink[-1].shape)]))
+    save_df(concat_dfs(feat_dfs_black), sensor[feature], 'GENEActiv_black')
+    save_df(concat_dfs(feat_dfs_pink), sensor[feature], 'GENEActiv_pink')
 
 def geneactiv_1c_data(open_csv, feature, label):
     """
@@ -531,30 +476,22 @@ def wavelet_acc(dirpath):
         y, z accelerometer value columns
     """
     csv_path = os.path.join(os.path.dirname(dirpath), 'accel')
-    acc_data = pd.DataFrame()
+    acc_dfs = []
     for acc in os.listdir(csv_path):
         if acc.endswith("csv"):
-            if acc_data.empty:
-                acc_data = pd.read_csv(os.path.join(csv_path, acc),
+            acc_dfs.append(pd.read_csv(os.path.join(csv_path, acc),
                            header=0, skip_blank_lines=True, comment="C",
                            parse_dates=['timestamp'], infer_datetime_format=
-                           True)
-                print(' : '.join([acc, str(acc_data.shape)]))
-            else:
-                acc_data = pd.concat([acc_data, pd.read_csv(os.path.join(
-                           csv_path, acc), header=0, skip_blank_lines=True,
-                           comment="C", parse_dates=['timestamp'],
-                           infer_datetime_format=True)])
+                           True))
             print(' : '.join(['Wavelet accelorometer data, adding',  acc, str(
-                      acc_data.shape)]))
+                      acc_dfs[-1].shape)]))
+    acc_data = concat_dfs(acc_dfs)
     acc_data_returns = pd.DataFrame()
     acc_data_returns[['Timestamp', 'x', 'y', 'z']] = acc_data[['timestamp',
                                                      'x', 'y', 'z']]
     acc_data_returns.set_index('Timestamp', inplace=True)
     # convert from 1/64g to g
-    for axis in axes:
-        acc_data_returns[axis] = acc_data_returns[axis].map(lambda x: float(x)/
-                                 64)
+    acc_data_returns[axes] = acc_data_returns[axes].astype(float) / 64
     save_df(acc_data_returns, 'accelerometer', 'Wavelet')
 
 def wavelet_ppg(dirpath):
@@ -581,19 +518,14 @@ def wavelet_ppg(dirpath):
         nanowatt PPG value columns
     """
     csv_path = os.path.join(dirpath, 'CSV')
-    ppg_data = pd.DataFrame()
+    ppg_dfs = []
     for ppg in os.listdir(csv_path):
         if ppg.endswith("csv"):
-            if ppg_data.empty:
-                ppg_data = pd.read_csv(os.path.join(csv_path, ppg),
-                           header=0, skip_blank_lines=True, comment="C")
-                print(' : '.join([ppg, str(ppg_data.shape)]))
-            else:
-                ppg_data = pd.concat([ppg_data, pd.read_csv(os.path.join(
-                           csv_path, ppg), header=0, skip_blank_lines=True,
-                           comment="C")])
+            ppg_dfs.append(pd.read_csv(os.path.join(csv_path, ppg),
+                           header=0, skip_blank_lines=True, comment="C"))
             print(' : '.join(['Wavelet photoplethysmograph data, adding',  ppg,
-                  str(ppg_data.shape)]))
+                  str(ppg_dfs[-1].shape)]))
+    ppg_data = concat_dfs(ppg_dfs)
     ppg_data['timestamp'] = ppg_data['timestamp'].map(lambda x:
                             datetime.fromtimestamp(int(x)/1000).strftime(
                             "%Y-%m-%d %H:%M:%S.%f"), na_action='ignore')
@@ -609,6 +541,25 @@ def wavelet_ppg(dirpath):
 general functions
 -----------------
 """
+def concat_dfs(dfs):
+    """
+    Function to concatenate a list of dataframes in a single pass rather than
+    growing one dataframe file by file.
+
+    Parameter
+    ---------
+    dfs : list of pandas dataframes
+        dataframes to concatenate, in order
+
+    Returns
+    -------
+    df : pandas dataframe
+        concatenated dataframe (empty if `dfs` is empty)
+    """
+    if not dfs:
+        return(pd.DataFrame())
+    return(pd.concat(dfs))
+
 def datetimedt(x):
     """
     Function to turn a datetime string in format "%Y-%m-%d %H:%M:%S.%f"